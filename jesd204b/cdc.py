@@ -0,0 +1,69 @@
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+
+class ResetAlignedBuffer(Module):
+    """Reset-Aligned Buffer
+    Shallow buffer between two clock domains running at the same frequency
+    with a fixed phase relationship (ex: jesd clock phase-locked to TXOUTCLK).
+
+    Unlike ElasticBuffer, the read side is not released by its own reset
+    but started by the write side through a synchronizer: the distance
+    between the pointers (and thus the latency) is the same after each
+    reset:
+        latency = 3 clock cycles (synchronizer + read register)
+    """
+    def __init__(self, width, depth, idomain, odomain):
+        self.reset = Signal() # idomain
+        self.din = Signal(width)
+        self.dout = Signal(width)
+        self.latency = 3
+
+        # # #
+
+        # power of 2 to let the pointers wrap
+        assert depth >= 4
+        assert (depth & (depth - 1)) == 0
+
+        storage = Memory(width, depth)
+        self.specials += storage
+
+        wrport = storage.get_port(write_capable=True, clock_domain=idomain)
+        rdport = storage.get_port(clock_domain=odomain)
+        self.specials += wrport, rdport
+
+        # write side
+        wrrun = Signal()
+        wrpointer = Signal(max=depth)
+        sync_write = getattr(self.sync, idomain)
+        sync_write += \
+            If(self.reset,
+                wrrun.eq(0),
+                wrpointer.eq(0)
+            ).Else(
+                wrrun.eq(1),
+                If(wrrun,
+                    wrpointer.eq(wrpointer + 1)
+                )
+            )
+
+        # read side, started by the write side
+        rdrun = Signal()
+        rdpointer = Signal(max=depth)
+        self.specials += MultiReg(wrrun, rdrun, odomain)
+        sync_read = getattr(self.sync, odomain)
+        sync_read += \
+            If(rdrun,
+                rdpointer.eq(rdpointer + 1)
+            ).Else(
+                rdpointer.eq(0)
+            )
+
+        self.comb += [
+            wrport.we.eq(1),
+            wrport.adr.eq(wrpointer),
+            wrport.dat_w.eq(self.din),
+
+            rdport.adr.eq(rdpointer),
+            self.dout.eq(rdport.dat_r)
+        ]
@@ -11,10 +11,21 @@ from litex.soc.interconnect.csr import *
 from jesd204b.transport import (JESD204BTransportTX,
                                 JESD204BSTPLGenerator)
 from jesd204b.link import JESD204BLinkTX
+from jesd204b.cdc import ResetAlignedBuffer
 
 
 class JESD204BCoreTX(Module):
-    def __init__(self, phys, jesd_settings, converter_data_width):
+    """Core TX
+    lane_cdc: clock domain crossing between the jesd domain and the phys:
+    - "elastic": ElasticBuffer (jesd and phys' clocks only mesochronous).
+    - "aligned": ResetAlignedBuffer of lane_cdc_depth, jesd clock phase-locked
+                 to the phys' TXOUTCLK, latency repeatable after each reset.
+    - "none":    lanes driven synchronously, jesd clock is the phys' clock.
+    """
+    def __init__(self, phys, jesd_settings, converter_data_width,
+                 lane_cdc="elastic", lane_cdc_depth=4):
+        assert lane_cdc in ["elastic", "aligned", "none"]
+
         self.enable = Signal()
         self.jsync = Signal()
         self.jref = Signal()
@@ -69,9 +80,6 @@ class JESD204BCoreTX(Module):
             # claim the phy
             setattr(self.submodules, phy_name, phy)
 
-            ebuf = ElasticBuffer(len(phy.data) + len(phy.ctrl), 4, "jesd", phy_cd)
-            setattr(self.submodules, "ebuf{}".format(n), ebuf)
-
             link = ClockDomainsRenamer("jesd")(
                 JESD204BLinkTX(len(phy.data), jesd_settings, n))
             # self.submodules += link
@@ -84,13 +92,27 @@ class JESD204BCoreTX(Module):
             ]
 
             # connect data
-            self.comb += [
-                link.sink.data.eq(lane),
-                ebuf.din[:len(phy.data)].eq(link.source.data),
-                ebuf.din[len(phy.data):].eq(link.source.ctrl),
-                phy.data.eq(ebuf.dout[:len(phy.data)]),
-                phy.ctrl.eq(ebuf.dout[len(phy.data):])
-            ]
+            self.comb += link.sink.data.eq(lane)
+            if lane_cdc == "none":
+                self.comb += [
+                    phy.data.eq(link.source.data),
+                    phy.ctrl.eq(link.source.ctrl)
+                ]
+            else:
+                if lane_cdc == "elastic":
+                    ebuf = ElasticBuffer(len(phy.data) + len(phy.ctrl),
+                        4, "jesd", phy_cd)
+                else:
+                    ebuf = ResetAlignedBuffer(len(phy.data) + len(phy.ctrl),
+                        lane_cdc_depth, "jesd", phy_cd)
+                    self.comb += ebuf.reset.eq(~phy_done)
+                setattr(self.submodules, "ebuf{}".format(n), ebuf)
+                self.comb += [
+                    ebuf.din[:len(phy.data)].eq(link.source.data),
+                    ebuf.din[len(phy.data):].eq(link.source.ctrl),
+                    phy.data.eq(ebuf.dout[:len(phy.data)]),
+                    phy.ctrl.eq(ebuf.dout[len(phy.data):])
+                ]
 
             # connect control
             self.comb += phy.transmitter.init.restart.eq(~self.enable)
@@ -0,0 +1,123 @@
+from migen import *
+from migen.genlib.fifo import AsyncFIFO
+
+
+class JESD204BTXGearbox(Module):
+    """TX Gearbox
+    Moves converters' samples from a user clock domain to the jesd clock
+    domain and adapts the number of samples per clock.
+    inputs:
+    - jesd_settings:        JESD204B settings
+    - converter_data_width: Converters' data width on the jesd side
+    - samples_per_clock:    Samples per converter per clock on the user side
+    - cd:                   User clock domain
+    - depth:                Depth of the clock domain crossing FIFO
+
+    The number of samples per clock of one side has to be a multiple of the
+    other: the packing/unpacking is done on the side with the lowest number
+    of samples per clock so that the FIFO is accessed at most once per clock.
+
+    sink (user domain):    converters' samples with valid/ready, ready is
+                           deasserted when the FIFO is full (backpressure).
+    source (jesd domain):  converters' samples for JESD204BCoreTX.sink,
+                           underflow is asserted on each jesd cycle without
+                           samples available (zeros are then transmitted).
+    """
+    def __init__(self, jesd_settings, converter_data_width, samples_per_clock,
+                 cd="sys", depth=16):
+        nbits = jesd_settings.phy.n
+        nconverters = jesd_settings.nconverters
+        jesd_samples_per_clock = converter_data_width//nbits
+        user_data_width = samples_per_clock*nbits
+
+        assert max(samples_per_clock, jesd_samples_per_clock)%min(
+            samples_per_clock, jesd_samples_per_clock) == 0
+
+        self.sink = sink = Record([("valid", 1), ("ready", 1)] +
+            [("converter"+str(i), user_data_width)
+                for i in range(nconverters)])
+        self.source = source = Record([("converter"+str(i), converter_data_width)
+            for i in range(nconverters)])
+        self.underflow = Signal()
+
+        # # #
+
+        fifo_data_width = max(user_data_width, converter_data_width)
+        fifo = AsyncFIFO(fifo_data_width*nconverters, depth)
+        fifo = ClockDomainsRenamer({"write": cd, "read": "jesd"})(fifo)
+        self.submodules.fifo = fifo
+
+        fifo_din = [fifo.din[i*fifo_data_width:(i+1)*fifo_data_width]
+            for i in range(nconverters)]
+        fifo_dout = [fifo.dout[i*fifo_data_width:(i+1)*fifo_data_width]
+            for i in range(nconverters)]
+
+        # user side: pack user words to jesd words
+        pack_ratio = max(jesd_samples_per_clock//samples_per_clock, 1)
+        if pack_ratio > 1:
+            words = [[Signal(user_data_width) for j in range(pack_ratio - 1)]
+                for i in range(nconverters)]
+            counter = Signal(max=pack_ratio)
+            sync = getattr(self.sync, cd)
+            sync += \
+                If(sink.valid & sink.ready,
+                    counter.eq(counter + 1),
+                    If(counter == (pack_ratio - 1),
+                        counter.eq(0)
+                    ),
+                    Case(counter, {j: [words[i][j].eq(
+                        getattr(sink, "converter"+str(i)))
+                            for i in range(nconverters)]
+                        for j in range(pack_ratio - 1)})
+                )
+            self.comb += [
+                fifo.we.eq(sink.valid & (counter == (pack_ratio - 1))),
+                [fifo_din[i].eq(Cat(*words[i],
+                    getattr(sink, "converter"+str(i))))
+                    for i in range(nconverters)]
+            ]
+        else:
+            self.comb += [
+                fifo.we.eq(sink.valid),
+                [fifo_din[i].eq(getattr(sink, "converter"+str(i)))
+                    for i in range(nconverters)]
+            ]
+        self.comb += sink.ready.eq(fifo.writable)
+
+        # jesd side: wait for the FIFO to be half filled, then unpack
+        # jesd words from FIFO words
+        unpack_ratio = max(samples_per_clock//jesd_samples_per_clock, 1)
+        prefill = depth//2*unpack_ratio
+        prefill_counter = Signal(max=prefill+1)
+        started = Signal()
+        self.sync.jesd += \
+            If(~started,
+                If(fifo.readable,
+                    prefill_counter.eq(prefill_counter + 1)
+                ),
+                If(prefill_counter == prefill,
+                    started.eq(1)
+                )
+            )
+
+        counter = Signal(max=max(unpack_ratio, 2))
+        self.comb += \
+            If(started,
+                If(fifo.readable,
+                    fifo.re.eq(counter == (unpack_ratio - 1)),
+                    Case(counter, {j: [getattr(source, "converter"+str(i)).eq(
+                        fifo_dout[i][j*converter_data_width:
+                                     (j+1)*converter_data_width])
+                            for i in range(nconverters)]
+                        for j in range(unpack_ratio)})
+                ).Else(
+                    self.underflow.eq(1)
+                )
+            )
+        if unpack_ratio > 1:
+            self.sync.jesd += \
+                If(fifo.re,
+                    counter.eq(0)
+                ).Elif(started & fifo.readable,
+                    counter.eq(counter + 1)
+                )
@@ -197,7 +197,8 @@ CLKIN +----> /M  +-->       Charge Pump         | +------------+->/2+--> CLKOUT
 
 
 class GTHTransmitter(Module, AutoCSR):
-    def __init__(self, pll, tx_pads, sys_clk_freq, polarity=0):
+    def __init__(self, pll, tx_pads, sys_clk_freq, polarity=0, multilane=False,
+                 shared_pll=False):
         self.prbs_config = Signal(2)
 
         self.produce_square_wave = CSRStorage()
@@ -213,11 +214,13 @@ class GTHTransmitter(Module, AutoCSR):
         use_qpll0 = isinstance(pll, GTHQuadPLL) and pll.config["qpll"] == "qpll0"
         use_qpll1 = isinstance(pll, GTHQuadPLL) and pll.config["qpll"] == "qpll1"
 
-        self.submodules.init = GTHInit(sys_clk_freq, False)
-        self.comb += [
-            self.init.plllock.eq(pll.lock),
-            pll.reset.eq(self.init.pllreset)
-        ]
+        self.submodules.init = GTHInit(sys_clk_freq, False, multilane, shared_pll)
+        # PLL reset/lock handled by TXInitController when shared
+        if not shared_pll:
+            self.comb += [
+                self.init.plllock.eq(pll.lock),
+                pll.reset.eq(self.init.pllreset)
+            ]
 
         nwords = 40//10
 
@@ -571,7 +574,7 @@ class GTHTransmitter(Module, AutoCSR):
             p_TXPI_VREFSEL                   =0b0,
             p_TXPMARESET_TIME                =0b00011,
             p_TXSYNC_MULTILANE               =0,
-            p_TXSYNC_OVRD                    =0b0,
+            p_TXSYNC_OVRD                    =0b1 if multilane else 0b0,
             p_TXSYNC_SKIP_DA                 =0b0,
             p_TX_CLK25_DIV                   =5,
             p_TX_CLKMUX_EN                   =0b1,
@@ -651,6 +654,13 @@ class GTHTransmitter(Module, AutoCSR):
             o_TXPHALIGNDONE=self.init.Xxphaligndone,
             i_TXUSERRDY=1,
 
+            # Multi-lane phase alignment (manual mode)
+            i_TXPHALIGNEN=1 if multilane else 0,
+            i_TXPHINIT=self.init.Xxphinit,
+            o_TXPHINITDONE=self.init.Xxphinitdone,
+            i_TXPHALIGN=self.init.Xxphalign,
+            i_TXDLYEN=self.init.Xxdlyen,
+
             # TX data
             i_TXCTRL0=Cat(*[txdata[10*i+8] for i in range(nwords)]),
             i_TXCTRL1=Cat(*[txdata[10*i+9] for i in range(nwords)]),
@@ -6,7 +6,8 @@ from migen.genlib.misc import WaitTimer
 
 
 class GTHInit(Module):
-    def __init__(self, sys_clk_freq, rx):
+    def __init__(self, sys_clk_freq, rx, multilane=False, shared_pll=False,
+                 ready_timeout=1e-3):
         self.done = Signal()
         self.restart = Signal()
 
@@ -19,6 +20,15 @@ class GTHInit(Module):
         self.Xxdlysresetdone = Signal()
         self.Xxphaligndone = Signal()
 
+        # GTH multi-lane phase alignment signals
+        # (driven by TXMultiLanePhaseAligner when multilane is set)
+        self.Xxphinit = Signal()
+        self.Xxphinitdone = Signal()
+        self.Xxphalign = Signal()
+        self.Xxdlyen = Signal()
+        self.align_request = Signal()
+        self.align_done = Signal()
+
         # # #
 
         # Double-latch transceiver asynch outputs
@@ -36,10 +46,9 @@ class GTHInit(Module):
         # Deglitch FSM outputs driving transceiver asynch inputs
         gtXxreset = Signal()
         Xxdlysreset = Signal()
-        self.sync += [
-            self.gtXxreset.eq(gtXxreset),
-            self.Xxdlysreset.eq(Xxdlysreset),
-        ]
+        self.sync += self.gtXxreset.eq(gtXxreset)
+        if not multilane:
+            self.sync += self.Xxdlysreset.eq(Xxdlysreset)
 
         # PLL reset must be at least 2us
         pll_reset_cycles = ceil(2000*sys_clk_freq/1000000000)
@@ -49,7 +58,7 @@ class GTHInit(Module):
         startup_fsm = ResetInserter()(FSM(reset_state="RESET_ALL"))
         self.submodules += startup_fsm
 
-        ready_timer = WaitTimer(1*sys_clk_freq//1000)
+        ready_timer = WaitTimer(int(round(ready_timeout*sys_clk_freq)))
         self.submodules += ready_timer
         self.comb += [
             ready_timer.wait.eq(~self.done & ~startup_fsm.reset),
@@ -65,14 +74,21 @@ class GTHInit(Module):
         self.sync += Xxphaligndone_r.eq(Xxphaligndone)
         self.comb += Xxphaligndone_rising.eq(Xxphaligndone & ~Xxphaligndone_r)
 
-        startup_fsm.act("RESET_ALL",
-            gtXxreset.eq(1),
-            self.pllreset.eq(1),
-            pll_reset_timer.wait.eq(1),
-            If(pll_reset_timer.done,
+        # PLL reset by TXInitController when shared
+        if shared_pll:
+            startup_fsm.act("RESET_ALL",
+                gtXxreset.eq(1),
                 NextState("RELEASE_PLL_RESET")
             )
-        )
+        else:
+            startup_fsm.act("RESET_ALL",
+                gtXxreset.eq(1),
+                self.pllreset.eq(1),
+                pll_reset_timer.wait.eq(1),
+                If(pll_reset_timer.done,
+                    NextState("RELEASE_PLL_RESET")
+                )
+            )
         startup_fsm.act("RELEASE_PLL_RESET",
             gtXxreset.eq(1),
             If(plllock, NextState("RELEASE_GTH_RESET"))
@@ -80,15 +96,22 @@ class GTHInit(Module):
         # Release GTH reset and wait for GTH resetdone
         # (from UG476, GTH is reset on falling edge
         # of gtXxreset)
+        align_state = "WAIT_MULTILANE_ALIGN" if multilane else "ALIGN"
         if rx:
             startup_fsm.act("RELEASE_GTH_RESET",
                 cdr_stable_timer.wait.eq(1),
-                If(Xxresetdone & cdr_stable_timer.done, NextState("ALIGN"))
+                If(Xxresetdone & cdr_stable_timer.done, NextState(align_state))
             )
         else:
             startup_fsm.act("RELEASE_GTH_RESET",
-                If(Xxresetdone, NextState("ALIGN"))
+                If(Xxresetdone, NextState(align_state))
             )
+        # Wait for alignment of all the lanes by TXMultiLanePhaseAligner
+        # (from UG576 in TX Buffer Bypass in Multi-Lane Manual Mode)
+        startup_fsm.act("WAIT_MULTILANE_ALIGN",
+            self.align_request.eq(1),
+            If(self.align_done, NextState("READY"))
+        )
         # Start delay alignment (pulse)
         startup_fsm.act("ALIGN",
             Xxdlysreset.eq(1),
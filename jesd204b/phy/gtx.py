@@ -183,7 +183,8 @@ CLKIN +----> /M  +-->       Charge Pump         | +------------+->/2+--> CLKOUT
 
 
 class GTXTransmitter(Module, AutoCSR):
-    def __init__(self, pll, tx_pads, sys_clk_freq, polarity=0):
+    def __init__(self, pll, tx_pads, sys_clk_freq, polarity=0, multilane=False,
+                 shared_pll=False):
         self.prbs_config = Signal(2)
 
         self.tp_on = CSRStorage()
@@ -199,11 +200,13 @@ class GTXTransmitter(Module, AutoCSR):
         use_cpll = isinstance(pll, GTXChannelPLL)
         use_qpll = isinstance(pll, GTXQuadPLL)
 
-        self.submodules.init = GTXInit(sys_clk_freq, False)
-        self.comb += [
-            self.init.plllock.eq(pll.lock),
-            pll.reset.eq(self.init.pllreset)
-        ]
+        self.submodules.init = GTXInit(sys_clk_freq, False, multilane, shared_pll)
+        # PLL reset/lock handled by TXInitController when shared
+        if not shared_pll:
+            self.comb += [
+                self.init.plllock.eq(pll.lock),
+                pll.reset.eq(self.init.pllreset)
+            ]
 
         nwords = 40//10
 
@@ -263,6 +266,13 @@ class GTXTransmitter(Module, AutoCSR):
                 o_TXPHALIGNDONE=self.init.Xxphaligndone,
                 i_TXUSERRDY=self.init.Xxuserrdy,
 
+                # Multi-lane phase alignment (manual mode)
+                i_TXPHALIGNEN=1 if multilane else 0,
+                i_TXPHINIT=self.init.Xxphinit,
+                o_TXPHINITDONE=self.init.Xxphinitdone,
+                i_TXPHALIGN=self.init.Xxphalign,
+                i_TXDLYEN=self.init.Xxdlyen,
+
                 # TX data
                 p_TX_DATA_WIDTH=40,
                 p_TX_INT_DATAWIDTH=1,
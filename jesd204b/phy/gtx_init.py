@@ -6,7 +6,8 @@ from migen.genlib.misc import WaitTimer
 
 
 class GTXInit(Module):
-    def __init__(self, sys_clk_freq, rx):
+    def __init__(self, sys_clk_freq, rx, multilane=False, shared_pll=False,
+                 ready_timeout=1e-3):
         self.done = Signal()
         self.restart = Signal()
 
@@ -20,6 +21,15 @@ class GTXInit(Module):
         self.Xxphaligndone = Signal()
         self.Xxuserrdy = Signal()
 
+        # GTX multi-lane phase alignment signals
+        # (driven by TXMultiLanePhaseAligner when multilane is set)
+        self.Xxphinit = Signal()
+        self.Xxphinitdone = Signal()
+        self.Xxphalign = Signal()
+        self.Xxdlyen = Signal()
+        self.align_request = Signal()
+        self.align_done = Signal()
+
         # # #
 
         # Double-latch transceiver asynch outputs
@@ -40,9 +50,10 @@ class GTXInit(Module):
         Xxuserrdy = Signal()
         self.sync += [
             self.gtXxreset.eq(gtXxreset),
-            self.Xxdlysreset.eq(Xxdlysreset),
             self.Xxuserrdy.eq(Xxuserrdy)
         ]
+        if not multilane:
+            self.sync += self.Xxdlysreset.eq(Xxdlysreset)
 
         # After configuration, transceiver resets have to stay low for
         # at least 500ns (see AR43482)
@@ -53,7 +64,7 @@ class GTXInit(Module):
         startup_fsm = ResetInserter()(FSM(reset_state="RESET_ALL"))
         self.submodules += startup_fsm
 
-        ready_timer = WaitTimer(1*sys_clk_freq//1000)
+        ready_timer = WaitTimer(int(round(ready_timeout*sys_clk_freq)))
         self.submodules += ready_timer
         self.comb += [
             ready_timer.wait.eq(~self.done & ~startup_fsm.reset),
@@ -69,9 +80,10 @@ class GTXInit(Module):
         self.sync += Xxphaligndone_r.eq(Xxphaligndone)
         self.comb += Xxphaligndone_rising.eq(Xxphaligndone & ~Xxphaligndone_r)
 
+        # PLL reset by TXInitController when shared
         startup_fsm.act("RESET_ALL",
             gtXxreset.eq(1),
-            self.pllreset.eq(1),
+            self.pllreset.eq(not shared_pll),
             startup_timer.wait.eq(1),
             NextState("RELEASE_PLL_RESET")
         )
@@ -83,17 +95,25 @@ class GTXInit(Module):
         # Release GTX reset and wait for GTX resetdone
         # (from UG476, GTX is reset on falling edge
         # of gtXxreset)
+        align_state = "WAIT_MULTILANE_ALIGN" if multilane else "ALIGN"
         if rx:
             startup_fsm.act("RELEASE_GTX_RESET",
                 Xxuserrdy.eq(1),
                 cdr_stable_timer.wait.eq(1),
-                If(Xxresetdone & cdr_stable_timer.done, NextState("ALIGN"))
+                If(Xxresetdone & cdr_stable_timer.done, NextState(align_state))
             )
         else:
             startup_fsm.act("RELEASE_GTX_RESET",
                 Xxuserrdy.eq(1),
-                If(Xxresetdone, NextState("ALIGN"))
+                If(Xxresetdone, NextState(align_state))
             )
+        # Wait for alignment of all the lanes by TXMultiLanePhaseAligner
+        # (from UG476 in TX Buffer Bypass in Multi-Lane Manual Mode)
+        startup_fsm.act("WAIT_MULTILANE_ALIGN",
+            Xxuserrdy.eq(1),
+            self.align_request.eq(1),
+            If(self.align_done, NextState("READY"))
+        )
         # Start delay alignment (pulse)
         startup_fsm.act("ALIGN",
             Xxuserrdy.eq(1),
@@ -0,0 +1,97 @@
+from functools import reduce
+from operator import and_
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+
+class TXMultiLanePhaseAligner(Module):
+    """TX Multi-Lane Phase Aligner
+    Aligns the TX phase of all the lanes in buffer bypass mode, the master
+    lane's TXOUTCLK being used as TXUSRCLK for all the lanes:
+    - TXDLYSRESET on all lanes, each lane waiting for its TXDLYSRESETDONE.
+    - TXPHINIT on all lanes, waiting for all TXPHINITDONE.
+    - TXPHALIGN on all lanes, waiting for all TXPHALIGNDONE.
+    - TXDLYEN on the master lane, waiting for its TXPHALIGNDONE rising edge.
+    cf UG476/UG576 TX Buffer Bypass in Multi-Lane Manual Mode
+    inputs:
+    - inits:  GTXInit/GTHInit of the lanes (created with multilane=True)
+    - master: Index of the master lane
+
+    Alignment starts when all the lanes are out of reset, so lanes have
+    to be restarted together (as done by JESD204BCoreTX).
+    """
+    def __init__(self, inits, master=0):
+        self.done = Signal()
+
+        # # #
+
+        nlanes = len(inits)
+
+        # Double-latch transceiver asynch outputs
+        dlysresetdone = Signal(nlanes)
+        phinitdone = Signal(nlanes)
+        phaligndone = Signal(nlanes)
+        for i, init in enumerate(inits):
+            self.specials += [
+                MultiReg(init.Xxdlysresetdone, dlysresetdone[i]),
+                MultiReg(init.Xxphinitdone, phinitdone[i]),
+                MultiReg(init.Xxphaligndone, phaligndone[i])
+            ]
+        master_phaligndone = phaligndone[master]
+        master_phaligndone_r = Signal(reset=1)
+        master_phaligndone_rising = Signal()
+        self.sync += master_phaligndone_r.eq(master_phaligndone)
+        self.comb += master_phaligndone_rising.eq(master_phaligndone &
+                                                  ~master_phaligndone_r)
+
+        # Deglitch FSM outputs driving transceiver asynch inputs
+        dlysreset = Signal(nlanes)
+        phinit = Signal()
+        phalign = Signal()
+        dlyen = Signal()
+        for i, init in enumerate(inits):
+            self.sync += [
+                init.Xxdlysreset.eq(dlysreset[i]),
+                init.Xxphinit.eq(phinit),
+                init.Xxphalign.eq(phalign),
+                init.Xxdlyen.eq(dlyen if i == master else 0)
+            ]
+
+        align_request = reduce(and_, [init.align_request for init in inits])
+        lanes_active = reduce(and_, [init.align_request | init.done
+            for init in inits])
+        for init in inits:
+            self.comb += init.align_done.eq(self.done)
+
+        fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.submodules += fsm
+        self.comb += fsm.reset.eq(~lanes_active)
+
+        # Wait for all the lanes to be out of reset
+        fsm.act("IDLE",
+            If(align_request, NextState("DLYSRESET"))
+        )
+        # Reset delay alignment, each lane until its reset done
+        fsm.act("DLYSRESET",
+            dlysreset.eq(~dlysresetdone),
+            If(dlysresetdone == (2**nlanes-1), NextState("PHINIT"))
+        )
+        # Initialize phase alignment
+        fsm.act("PHINIT",
+            phinit.eq(1),
+            If(phinitdone == (2**nlanes-1), NextState("PHALIGN"))
+        )
+        # Align phase
+        fsm.act("PHALIGN",
+            phalign.eq(1),
+            If(phaligndone == (2**nlanes-1), NextState("DLYEN"))
+        )
+        # Enable delay alignment on master lane
+        fsm.act("DLYEN",
+            dlyen.eq(1),
+            If(master_phaligndone_rising, NextState("READY"))
+        )
+        fsm.act("READY",
+            self.done.eq(1)
+        )
@@ -0,0 +1,132 @@
+from functools import reduce
+from operator import and_, or_
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+from migen.genlib.misc import WaitTimer
+
+from litex.soc.interconnect.csr import *
+
+
+class TXInitController(Module, AutoCSR):
+    """TX Init Controller
+    Shared initialization of the transceivers of a link:
+    - resets each PLL once (instead of once per lane),
+    - releases all the channels in parallel once the PLLs are locked,
+    - restarts the sequence when a state times out,
+    - reports the elapsed bring-up time in sys_clk cycles.
+    inputs:
+    - inits:            GTXInit/GTHInit of the lanes (created with
+                        shared_pll=True)
+    - plls:             PLLs used by the lanes (a shared QPLL can be
+                        listed for each lane, it is only reset once)
+    - sys_clk_freq:     System clock frequency
+    - pll_reset_time:   PLL reset duration (s)
+    - pll_lock_timeout: Maximum duration for the PLLs to lock (s)
+    - init_timeout:     Maximum duration for the channels to be ready (s)
+
+    The sequence is restarted when the lanes are restarted (ex: by
+    JESD204BCoreTX when disabled).
+    """
+    def __init__(self, inits, plls, sys_clk_freq,
+                 pll_reset_time=2e-6,
+                 pll_lock_timeout=1e-3,
+                 init_timeout=1e-3):
+        self.done = Signal()
+
+        self.elapsed = CSRStatus(32)
+        self.retries = CSRStatus(8)
+
+        # # #
+
+        unique_plls = []
+        for pll in plls:
+            if not any(pll is p for p in unique_plls):
+                unique_plls.append(pll)
+
+        # Double-latch PLLs' asynch lock outputs
+        plls_lock = Signal(len(unique_plls))
+        for i, pll in enumerate(unique_plls):
+            self.specials += MultiReg(pll.lock, plls_lock[i])
+        plls_locked = Signal()
+        self.comb += plls_locked.eq(plls_lock == (2**len(unique_plls)-1))
+
+        # Deglitch FSM output driving PLLs' asynch reset inputs
+        plls_reset = Signal()
+        plls_reset_r = Signal()
+        self.sync += plls_reset_r.eq(plls_reset)
+        for pll in unique_plls:
+            self.comb += pll.reset.eq(plls_reset_r)
+
+        # Channels are held until the PLLs are locked, then released
+        # together
+        channels_release = Signal()
+        for init in inits:
+            self.comb += init.plllock.eq(channels_release & plls_locked)
+        channels_done = reduce(and_, [init.done for init in inits])
+        restart = reduce(or_, [init.restart for init in inits])
+
+        pll_reset_timer = WaitTimer(int(round(pll_reset_time*sys_clk_freq)))
+        pll_lock_timer = WaitTimer(int(round(pll_lock_timeout*sys_clk_freq)))
+        init_timer = WaitTimer(int(round(init_timeout*sys_clk_freq)))
+        self.submodules += pll_reset_timer, pll_lock_timer, init_timer
+
+        fsm = ResetInserter()(FSM(reset_state="RESET_PLLS"))
+        self.submodules += fsm
+        self.comb += fsm.reset.eq(restart)
+
+        # Elapsed time since restart and retries
+        elapsed = Signal(32)
+        retries = Signal(8)
+        self.sync += [
+            If(restart,
+                elapsed.eq(0),
+                retries.eq(0)
+            ).Elif(~self.done & (elapsed != (2**32-1)),
+                elapsed.eq(elapsed + 1)
+            ),
+            If(pll_lock_timer.done | init_timer.done,
+                If(retries != (2**8-1),
+                    retries.eq(retries + 1)
+                )
+            )
+        ]
+        self.comb += [
+            self.elapsed.status.eq(elapsed),
+            self.retries.status.eq(retries)
+        ]
+
+        # Reset PLLs once
+        fsm.act("RESET_PLLS",
+            plls_reset.eq(1),
+            pll_reset_timer.wait.eq(1),
+            If(pll_reset_timer.done,
+                NextState("WAIT_PLLS_LOCK")
+            )
+        )
+        # Wait for all the PLLs to lock
+        fsm.act("WAIT_PLLS_LOCK",
+            pll_lock_timer.wait.eq(1),
+            If(pll_lock_timer.done,
+                NextState("RESET_PLLS")
+            ).Elif(plls_locked,
+                NextState("RELEASE_CHANNELS")
+            )
+        )
+        # Release all the channels in parallel
+        fsm.act("RELEASE_CHANNELS",
+            channels_release.eq(1),
+            init_timer.wait.eq(1),
+            If(init_timer.done,
+                NextState("RESET_PLLS")
+            ).Elif(channels_done,
+                NextState("READY")
+            )
+        )
+        fsm.act("READY",
+            channels_release.eq(1),
+            self.done.eq(1),
+            If(~plls_locked,
+                NextState("RESET_PLLS")
+            )
+        )
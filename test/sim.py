@@ -0,0 +1,93 @@
+import numpy as np
+
+from migen import *
+
+
+class LayoutMap:
+    """Bit-index map of signals sliced in fixed-width units
+    inputs:
+    - signals:    Record or list of signals (first one on the LSBs)
+    - unit_width: Width of a unit (octet: 8, sample: converter bits, ...)
+
+    The slicing is computed once for the layout: test benches pack/unpack
+    whole cycles as NumPy rows outside of the simulation loop and only move
+    a single integer per cycle in and out of the simulator.
+    """
+    def __init__(self, signals, unit_width):
+        if isinstance(signals, Record):
+            signals = signals.flatten()
+        for s in signals:
+            assert len(s)%unit_width == 0
+        self.signals = signals
+        self.unit_width = unit_width
+        self.target = Cat(*signals)
+        self.nunits = len(self.target)//unit_width
+
+        units_per_signal = {len(s)//unit_width for s in signals}
+        if len(units_per_signal) == 1:
+            self.shape = (len(signals), units_per_signal.pop())
+        else:
+            self.shape = (self.nunits,)
+
+        self.mask = 2**unit_width-1
+        self.shifts = np.arange(self.nunits, dtype=object)*unit_width
+        if unit_width in [8, 16, 32, 64]:
+            self.dtype = np.dtype("<u{}".format(unit_width//8))
+        else:
+            self.dtype = None
+
+    def pack(self, data):
+        """Converts an array of units (ncycles, ...) to one integer per cycle"""
+        data = np.asarray(data).reshape(-1, self.nunits)
+        if self.dtype is not None:
+            nbytes = self.nunits*self.dtype.itemsize
+            raw = data.astype(self.dtype).tobytes()
+            return [int.from_bytes(raw[i:i+nbytes], byteorder="little")
+                for i in range(0, len(raw), nbytes)]
+        else:
+            data = data.astype(object) & self.mask
+            return list((data << self.shifts).sum(axis=1))
+
+    def unpack(self, values):
+        """Converts one integer per cycle to an array of units (ncycles, ...)"""
+        if self.dtype is not None:
+            nbytes = self.nunits*self.dtype.itemsize
+            raw = b"".join(v.to_bytes(nbytes, byteorder="little")
+                for v in values)
+            data = np.frombuffer(raw, dtype=self.dtype).astype(np.int64)
+        else:
+            values = np.array(values, dtype=object).reshape(-1, 1)
+            data = ((values >> self.shifts) & self.mask).astype(np.int64)
+        return data.reshape((-1,) + self.shape)
+
+
+class Driver:
+    """Drives a cycle of units on signals at each clock"""
+    def __init__(self, signals, unit_width):
+        self.map = LayoutMap(signals, unit_width)
+
+    def generator(self, data, skip=0):
+        values = self.map.pack(data)
+        for i in range(skip):
+            yield
+        for value in values:
+            yield self.map.target.eq(value)
+            yield
+
+
+class Monitor:
+    """Collects a cycle of units from signals at each clock"""
+    def __init__(self, signals, unit_width):
+        self.map = LayoutMap(signals, unit_width)
+        self.values = []
+
+    def generator(self, ncycles, skip=0):
+        for i in range(skip):
+            yield
+        for i in range(ncycles):
+            self.values.append((yield self.map.target))
+            yield
+
+    @property
+    def data(self):
+        return self.map.unpack(self.values)
@@ -0,0 +1,49 @@
+import unittest
+
+from migen import *
+
+from jesd204b.cdc import ResetAlignedBuffer
+
+
+class BufferDUT(Module):
+    def __init__(self):
+        self.clock_domains.cd_write = ClockDomain()
+        self.clock_domains.cd_read = ClockDomain()
+        self.submodules.buffer = ResetAlignedBuffer(8, 4, "write", "read")
+
+
+def latency_test(resets):
+    dut = BufferDUT()
+    buf = dut.buffer
+    latencies = []
+
+    def write_generator():
+        for r in range(resets):
+            yield buf.reset.eq(1)
+            for i in range(8):
+                yield
+            yield buf.reset.eq(0)
+            for i in range(32):
+                yield buf.din.eq(i+1)
+                yield
+
+    def read_generator():
+        for r in range(resets):
+            for i in range(8):
+                yield
+            for i in range(32):
+                if (yield buf.dout) == 8:
+                    latencies.append(i - 8)
+                yield
+
+    run_simulation(dut,
+        {"write": write_generator(), "read": read_generator()},
+        {"write": 10, "read": (10, 3)})
+
+    return latencies
+
+
+class TestCDC(unittest.TestCase):
+    def test_reset_aligned_buffer(self):
+        latencies = latency_test(4)
+        self.assertEqual(latencies, [ResetAlignedBuffer(8, 4, "write", "read").latency]*4)
@@ -0,0 +1,85 @@
+import unittest
+
+from migen import *
+
+from jesd204b.common import *
+from jesd204b.gearbox import JESD204BTXGearbox
+
+
+class GearboxDUT(Module):
+    def __init__(self, jesd_settings, converter_data_width, samples_per_clock):
+        self.clock_domains.cd_user = ClockDomain()
+        self.clock_domains.cd_jesd = ClockDomain()
+        self.submodules.gearbox = JESD204BTXGearbox(jesd_settings,
+                                                    converter_data_width,
+                                                    samples_per_clock,
+                                                    cd="user")
+
+
+def gearbox_test(samples_per_clock, user_period, jesd_period, nwords=64):
+    ps = JESD204BPhysicalSettings(l=2, m=2, n=16, np=16)
+    ts = JESD204BTransportSettings(f=2, s=1, k=16, cs=0)
+    jesd_settings = JESD204BSettings(ps, ts, did=0x5a, bid=0x5)
+    converter_data_width = 64
+    jesd_samples_per_clock = converter_data_width//16
+
+    dut = GearboxDUT(jesd_settings, converter_data_width, samples_per_clock)
+    gearbox = dut.gearbox
+    gearbox.errors = 0
+    gearbox.samples = [[] for c in range(2)]
+
+    def sample(c, k):
+        return (c << 12) + k + 1
+
+    def user_generator():
+        yield gearbox.sink.valid.eq(1)
+        for w in range(nwords):
+            for c in range(2):
+                data = 0
+                for j in range(samples_per_clock):
+                    data |= sample(c, w*samples_per_clock+j) << 16*j
+                yield getattr(gearbox.sink, "converter"+str(c)).eq(data)
+            yield
+            if not (yield gearbox.sink.ready):
+                gearbox.errors += 1
+        yield gearbox.sink.valid.eq(0)
+
+    def jesd_generator():
+        ncycles = nwords*samples_per_clock//jesd_samples_per_clock
+        for i in range(ncycles + 64):
+            data = (yield gearbox.source.converter0)
+            if data != 0:
+                for c in range(2):
+                    data = (yield getattr(gearbox.source, "converter"+str(c)))
+                    gearbox.samples[c] += [(data >> 16*j) & 0xffff
+                        for j in range(jesd_samples_per_clock)]
+                if (yield gearbox.underflow):
+                    gearbox.errors += 1
+            yield
+
+    run_simulation(dut,
+        {"user": user_generator(), "jesd": jesd_generator()},
+        {"user": user_period, "jesd": jesd_period})
+
+    return gearbox
+
+
+class TestGearbox(unittest.TestCase):
+    def check(self, gearbox):
+        self.assertEqual(gearbox.errors, 0)
+        for c in range(2):
+            samples = gearbox.samples[c]
+            self.assertGreater(len(samples), 0)
+            self.assertEqual(samples,
+                [(c << 12) + k + 1 for k in range(len(samples))])
+
+    def test_gearbox_pack(self):
+        # 2 samples/clk @ user --> 4 samples/clk @ jesd
+        self.check(gearbox_test(2, 4, 8))
+
+    def test_gearbox_unpack(self):
+        # 8 samples/clk @ user --> 4 samples/clk @ jesd
+        self.check(gearbox_test(8, 16, 8))
+
+    def test_gearbox_passthrough(self):
+        self.check(gearbox_test(4, 8, 8))
@@ -1,6 +1,8 @@
 import unittest
 import random
 
+import numpy as np
+
 from migen import *
 
 from jesd204b.link import link_layout
@@ -9,6 +11,7 @@ from jesd204b.link import Scrambler, Framer, AlignInserter
 from test.model.common import Control
 from test.model.link import scramble_lanes
 from test.model.link import insert_alignment_characters
+from test.sim import Driver, Monitor
 
 
 class LinkTXDatapath(Module):
@@ -41,9 +44,9 @@ class TestLink(unittest.TestCase):
                                                    scrambled=True,
                                                    lanes=output_lanes)
         link = ResetInserter()(LinkTXDatapath(data_width))
-        link.output_lane = []
 
         octets_per_cycle = data_width//8
+        ncycles = len(input_lane)*2//octets_per_cycle
 
         def flatten_lane(lane):
             flat_lane = []
@@ -51,32 +54,23 @@ class TestLink(unittest.TestCase):
                 flat_lane += frame
             return flat_lane
 
-        def get_lane_data(lane, cycle):
-            flat_lane = flatten_lane(lane)
-            data = flat_lane[octets_per_cycle*cycle:octets_per_cycle*(cycle+1)]
-            return int.from_bytes(data, byteorder='little') if data != [] else None
-
-        def generator(dut):
+        def reset(dut):
             yield dut.reset.eq(1)
             yield
             yield dut.reset.eq(0)
-            for i in range(2048):
-                # set sink data
-                sink_data = get_lane_data(input_lane, i)
-                if sink_data is not None:
-                    yield dut.sink.data.eq(sink_data)
-                if i > dut.latency:
-                    # get source data
-                    source_data = (yield dut.source.data)
-                    source_ctrl = (yield dut.source.ctrl)
-                    data = list(source_data.to_bytes(octets_per_cycle,
-                                                     byteorder='little'))
-                    for i in range(octets_per_cycle):
-                        if source_ctrl & (1<<i):
-                            data[i] = Control(data[i])
-                    dut.output_lane += data
-                yield
 
-        run_simulation(link, generator(link))
+        driver = Driver(link.sink, 8)
+        data_monitor = Monitor([link.source.data], 8)
+        ctrl_monitor = Monitor([link.source.ctrl], 1)
+        skip = 2 + link.latency
+
+        run_simulation(link, [
+            reset(link),
+            driver.generator(np.array(flatten_lane(input_lane)), skip=1),
+            data_monitor.generator(ncycles, skip=skip),
+            ctrl_monitor.generator(ncycles, skip=skip)])
+        output_lane = [Control(d) if k else d
+            for d, k in zip(data_monitor.data.flatten().tolist(),
+                            ctrl_monitor.data.flatten().tolist())]
         reference = flatten_lane(output_lanes[0])
-        self.assertEqual(link.output_lane[:len(reference)], reference)
+        self.assertEqual(output_lane[:len(reference)], reference)
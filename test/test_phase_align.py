@@ -0,0 +1,74 @@
+import unittest
+
+from migen import *
+
+from jesd204b.phy.gtx_init import GTXInit
+from jesd204b.phy.phase_align import TXMultiLanePhaseAligner
+
+
+class PhaseAlignDUT(Module):
+    def __init__(self, nlanes):
+        self.inits = [GTXInit(10000000, False, multilane=True)
+            for i in range(nlanes)]
+        self.submodules += self.inits
+        self.submodules.aligner = TXMultiLanePhaseAligner(self.inits)
+        for init in self.inits:
+            self.comb += init.plllock.eq(1)
+
+
+def transceiver_model(dut, init, n, master, events):
+    # responds to the multi-lane phase alignment sequence with a lane
+    # dependent delay and records when lanes are phase aligned
+    delay = 3 + n
+    yield init.Xxresetdone.eq(1)
+    while not (yield init.Xxdlysreset):
+        yield
+    for i in range(delay):
+        yield
+    yield init.Xxdlysresetdone.eq(1)
+    while not (yield init.Xxphinit):
+        yield
+    events.append(("phinit", n))
+    for i in range(delay):
+        yield
+    yield init.Xxphinitdone.eq(1)
+    while not (yield init.Xxphalign):
+        yield
+    events.append(("phalign", n))
+    for i in range(delay):
+        yield
+    yield init.Xxphaligndone.eq(1)
+    if n == master:
+        while not (yield init.Xxdlyen):
+            yield
+        events.append(("dlyen", n))
+        yield init.Xxphaligndone.eq(0)
+        for i in range(delay):
+            yield
+        yield init.Xxphaligndone.eq(1)
+    for i in range(64):
+        yield
+
+
+class TestPhaseAlign(unittest.TestCase):
+    def test_multilane_phase_align(self, nlanes=4):
+        dut = PhaseAlignDUT(nlanes)
+        events = []
+        dones = []
+
+        def check():
+            for i in range(512):
+                yield
+            for init in dut.inits:
+                dones.append((yield init.done))
+
+        run_simulation(dut,
+            [transceiver_model(dut, init, n, 0, events)
+                for n, init in enumerate(dut.inits)] + [check()])
+
+        self.assertEqual(dones, [1]*nlanes)
+        # all lanes initialized before alignment, all lanes aligned before
+        # master delay alignment
+        self.assertEqual([e[0] for e in events],
+            ["phinit"]*nlanes + ["phalign"]*nlanes + ["dlyen"])
+        self.assertEqual(events[-1], ("dlyen", 0))
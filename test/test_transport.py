@@ -1,5 +1,6 @@
 import unittest
-from math import ceil
+
+import numpy as np
 
 from migen import *
 
@@ -7,6 +8,7 @@ from jesd204b.common import *
 from jesd204b.transport import JESD204BTransportTX
 
 from test.model.transport import samples_to_lanes
+from test.sim import Driver, Monitor
 
 
 class TestTransport(unittest.TestCase):
@@ -26,29 +28,25 @@ class TestTransport(unittest.TestCase):
                                            nbits=16,
                                            samples=input_samples)
 
-        output_lanes = [[] for i in range(nlanes)]
-
         octets_per_lane = jesd_settings.octets_per_lane
-        lane_data_width = len(transport.source.lane0)
-
-        def generator(dut):
-            for i in range(5):
-                if i < 4:
-                    for c in range(nconverters):
-                        converter_data = getattr(dut.sink, "converter"+str(c))
-                        for j in range(nconverters):
-                            yield converter_data[16*j:16*(j+1)].eq(input_samples[c][4*i+j])
-                if i > 0:
-                    for l in range(nlanes):
-                        lane_data = (yield getattr(dut.source, "lane"+str(l)))
-                        for f in range(lane_data_width//(octets_per_lane*8)):
-                            frame = [(lane_data >> (f*8*octets_per_lane)+8*i) & 0xff
-                                for i in range(octets_per_lane)]
-                            output_lanes[l].append(frame)
-                yield
-
-        run_simulation(transport, generator(transport))
-        return reference_lanes, output_lanes
+        samples_per_clock = converter_data_width//16
+        ncycles = 16//samples_per_clock
+
+        # sink rows: (cycle, converter, sample)
+        sink_data = np.array(input_samples).reshape(
+            nconverters, ncycles, samples_per_clock).transpose(1, 0, 2)
+
+        driver = Driver(transport.sink, 16)
+        monitor = Monitor(transport.source, 8)
+        run_simulation(transport, [
+            driver.generator(sink_data),
+            monitor.generator(ncycles, skip=1)])
+
+        # source rows: (cycle, lane, octet) --> lanes' frames
+        output_lanes = monitor.data.reshape(
+            ncycles, nlanes, -1, octets_per_lane).transpose(1, 0, 2, 3)
+        output_lanes = output_lanes.reshape(nlanes, -1, octets_per_lane)
+        return reference_lanes, output_lanes.tolist()
 
 
     def test_transport_tx(self):
@@ -0,0 +1,80 @@
+import unittest
+
+from migen import *
+
+from jesd204b.phy.gtx_init import GTXInit
+from jesd204b.phy.tx_init import TXInitController
+
+
+class PLLModel(Module):
+    def __init__(self):
+        self.reset = Signal()
+        self.lock = Signal()
+
+
+class TXInitDUT(Module):
+    def __init__(self, nlanes):
+        sys_clk_freq = 10000000
+        self.pll = PLLModel()
+        self.inits = [GTXInit(sys_clk_freq, False, shared_pll=True)
+            for i in range(nlanes)]
+        self.submodules += self.inits
+        self.submodules.controller = TXInitController(self.inits,
+            [self.pll]*nlanes, sys_clk_freq, pll_lock_timeout=10e-6)
+
+
+def pll_model(pll, lock_attempt, events):
+    # locks after the lock_attempt-th reset
+    attempt = 0
+    while True:
+        if (yield pll.reset):
+            events.append("reset")
+            yield pll.lock.eq(0)
+            while (yield pll.reset):
+                yield
+            attempt += 1
+            if attempt >= lock_attempt:
+                for i in range(8):
+                    yield
+                yield pll.lock.eq(1)
+        yield
+
+
+def transceiver_model(init):
+    yield init.Xxresetdone.eq(1)
+    yield
+
+
+class TestTXInit(unittest.TestCase):
+    def tx_init_test(self, nlanes, lock_attempt):
+        dut = TXInitDUT(nlanes)
+        events = []
+        results = {}
+
+        def check():
+            for i in range(4096):
+                yield
+            results["done"] = (yield dut.controller.done)
+            results["inits_done"] = []
+            for init in dut.inits:
+                results["inits_done"].append((yield init.done))
+            results["elapsed"] = (yield dut.controller.elapsed.status)
+            results["retries"] = (yield dut.controller.retries.status)
+
+        run_simulation(dut,
+            [pll_model(dut.pll, lock_attempt, events), check()] +
+            [transceiver_model(init) for init in dut.inits])
+
+        self.assertEqual(results["done"], 1)
+        self.assertEqual(results["inits_done"], [1]*nlanes)
+        # shared PLL reset once per attempt, not once per lane
+        self.assertEqual(events, ["reset"]*lock_attempt)
+        self.assertEqual(results["retries"], lock_attempt - 1)
+        self.assertGreater(results["elapsed"], 0)
+        self.assertLess(results["elapsed"], 4096)
+
+    def test_tx_init(self):
+        self.tx_init_test(4, 1)
+
+    def test_tx_init_retry(self):
+        self.tx_init_test(2, 2)